@@ -7,3 +7,7 @@ class ResourceNotFound(Exception):
         self.resource_name = resource_name
         self.resource_type = resource_type
         super().__init__(f'{resource_type} {self.resource_name} not found in Octopus')
+
+    def __reduce__(self):
+        # The constructor arguments differ from the exception args, so copies are made from the resource details
+        return ResourceNotFound, (self.resource_type, self.resource_name)
@@ -1,7 +1,7 @@
 import re
 from functools import reduce
 
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 
 from domain.converters.string_to_int import string_to_int
 from domain.date.parse_dates import parse_unknown_format_date
@@ -211,8 +211,8 @@ def step_index_is_valid(step, input_query):
 
 
 def step_name_is_fuzzy_match(step_name, step_names):
-    return any(
-        filter(lambda s: fuzz.ratio(normalize_log_step_name(step_name), normalize_log_step_name(s)) > 80, step_names))
+    normalized_step_name = normalize_log_step_name(step_name)
+    return any(fuzz.ratio(normalized_step_name, normalize_log_step_name(s), score_cutoff=80) > 80 for s in step_names)
 
 
 def normalize_log_step_name(name):
@@ -337,8 +337,8 @@ def get_item_fuzzy(items, name):
     if not name:
         return None
 
-    case_sensitive_items = []
-    fuzz_match = []
+    case_insensitive_item = None
+    fuzzy_items = []
 
     for item in items:
         if "Name" not in item:
@@ -347,18 +347,19 @@ def get_item_fuzzy(items, name):
         if item["Name"] == name:
             return item
 
-        if item["Name"].casefold() == name.casefold():
-            case_sensitive_items.append(item)
+        if case_insensitive_item is None and item["Name"].casefold() == name.casefold():
+            case_insensitive_item = item
 
-        fuzz_match.append({"ratio": fuzz.ratio(name, item["Name"]), "item": item})
+        fuzzy_items.append(item)
 
-    if case_sensitive_items:
-        return case_sensitive_items[0]
+    if case_insensitive_item is not None:
+        return case_insensitive_item
 
-    fuzz_match_sorted = sorted(fuzz_match, key=lambda x: x["ratio"], reverse=True)
+    # extractOne scores all the names in a single call and returns the first of the highest scoring matches
+    best_match = process.extractOne(name, [item["Name"] for item in fuzzy_items], scorer=fuzz.ratio)
 
-    if len(fuzz_match_sorted) != 0:
-        return fuzz_match_sorted[0]["item"]
+    if best_match:
+        return fuzzy_items[best_match[2]]
 
     return None
 
@@ -375,7 +376,9 @@ def get_item_fuzzy_generator(items_generator, name):
     """
 
     case_insensitive = None
-    fuzzy_matches = []
+    casefold_name = name.casefold()
+    best_ratio = 0
+    best_item = None
     for item in items_generator():
         # Early exit on exact name match. If the generator function uses lazy loading, this can have
         # a performance benefit.
@@ -383,21 +386,23 @@ def get_item_fuzzy_generator(items_generator, name):
             return {"original": name, "matched": item}
 
         # Track any case-insensitive matches
-        if item["Name"].casefold() == name.casefold():
+        if item["Name"].casefold() == casefold_name:
             case_insensitive = item
 
-        # Calculate the fuzzy match
-        ratio = fuzz.ratio(name, item["Name"])
-        fuzzy_matches.append({"ratio": ratio, "item": item})
+        # Track the best fuzzy match. The best ratio so far is passed as the cutoff, so rapidfuzz can skip the full
+        # calculation for names that can't beat it. Only a strictly higher ratio replaces the current best, so the
+        # first of any equally good matches is kept.
+        ratio = fuzz.ratio(name, item["Name"], score_cutoff=best_ratio)
+        if best_item is None or ratio > best_ratio:
+            best_ratio = ratio
+            best_item = item
 
     # In the absence of an exact match, return a case-insensitive match
     if case_insensitive:
         return {"original": name, "matched": case_insensitive}
 
     # Fall back to the best fuzzy match
-    fuzz_match_sorted = sorted(fuzzy_matches, key=lambda x: x["ratio"], reverse=True)
-
-    if len(fuzz_match_sorted) != 0:
-        return {"original": name, "matched": fuzz_match_sorted[0]["item"]}
+    if best_item is not None:
+        return {"original": name, "matched": best_item}
 
     return None
@@ -1,3 +1,4 @@
+import functools
 import urllib.parse
 
 
@@ -11,7 +12,7 @@ def quote_safe(string):
         return ""
 
     if isinstance(string, str):
-        return urllib.parse.quote(string, safe='')
+        return quote_string(string)
 
     if isinstance(string, (int, float, complex, bool)):
         return str(string)
@@ -19,3 +20,13 @@ def quote_safe(string):
     # If something other than a string or number is passed, assume something
     # unsafe was passed in, and return an empty string
     return ""
+
+
+@functools.lru_cache(maxsize=256)
+def quote_string(string):
+    """
+    URL quote a string. The same IDs are quoted many times when making API requests, so the results are cached.
+    :param string: The string to be quoted
+    :return: The URL quoted string
+    """
+    return urllib.parse.quote(string, safe='')
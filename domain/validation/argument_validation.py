@@ -1,3 +1,7 @@
+import functools
+import inspect
+
+
 def ensure_string_not_empty(value, error_message):
     """
     Ensures the value is a non-empty string
@@ -39,3 +43,31 @@ def ensure_not_falsy(value, error_message):
     """
     if not value:
         raise ValueError(error_message)
+
+
+def ensure_strings_not_empty(**error_messages):
+    """
+    A decorator that ensures the named arguments are non-empty strings. The position of each argument is looked up
+    once when the function is decorated, so each call only needs a single pass over the arguments.
+    :param error_messages: The error message to raise for each argument that fails the test, keyed by argument name
+    :return: The decorator
+    """
+
+    def decorator(func):
+        parameters = inspect.signature(func).parameters
+        names = list(parameters)
+        checks = [(names.index(name), name, parameters[name].default, message)
+                  for name, message in error_messages.items()]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for index, name, default, message in checks:
+                value = args[index] if index < len(args) else kwargs.get(name, default)
+                if not value or not isinstance(value, str) or not value.strip():
+                    raise ValueError(message)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
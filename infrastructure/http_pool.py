@@ -1,4 +1,87 @@
+import asyncio
+
+import aiohttp
 import urllib3
+from urllib3.util import Retry
 
 TAKE_ALL = 10000
-http = urllib3.PoolManager()
+
+# The longest time a Retry-After header, or the exponential backoff, can delay a retried request
+max_retry_delay = 4.0
+
+
+class CappedRetry(Retry):
+    """
+    A retry policy that limits the delay requested by a Retry-After header to max_retry_delay, so a server asking
+    for a long delay does not hold up the request handler.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, max_retry_delay)
+
+
+# Transient failures of Octopus requests are retried with a jittered exponential backoff, honoring any Retry-After
+# header up to max_retry_delay. Only idempotent methods are retried, so POST requests that create resources are never
+# sent twice. raise_on_status is disabled so the final response is returned to the caller once the retries are
+# exhausted. The policy is passed with each Octopus request, and the same policy is applied to async requests made
+# with aiohttp. Requests to other services, like GitHub and Slack, keep the pool's default retries.
+retry_policy = CappedRetry(total=3, backoff_factor=0.5, backoff_jitter=0.3, backoff_max=max_retry_delay,
+                           status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+
+# Up to 64 connections are kept alive for each host so concurrent callers don't discard and reopen sockets.
+http = urllib3.PoolManager(maxsize=64, block=False)
+
+# aiohttp sessions are bound to the event loop they were created in, and each call to asyncio.run()
+# creates a new loop, so a shared session is maintained for each running loop. asyncio semaphores are also bound
+# to the loop they are first used in, so each session has its own semaphore limiting the concurrent requests.
+sessions = {}
+
+# The number of concurrent async requests made on each event loop
+max_concurrent_requests = 10
+
+
+async def get_session():
+    """
+    Returns an aiohttp session shared by all requests made on the current event loop. Reusing the
+    session allows connections to be kept alive between requests.
+    :return: The shared aiohttp session
+    """
+    return (await get_loop_resources())[0]
+
+
+async def get_semaphore():
+    """
+    Returns the semaphore limiting the number of concurrent requests made on the current event loop.
+    :return: The shared semaphore
+    """
+    return (await get_loop_resources())[1]
+
+
+async def get_loop_resources():
+    """
+    Returns the session and semaphore for the current event loop, creating them if necessary.
+    :return: The session and semaphore
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in sessions:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=75))
+        lifetime = session_lifetime(loop, session)
+        await lifetime.__anext__()
+        sessions[loop] = lifetime, session, asyncio.Semaphore(max_concurrent_requests)
+
+    return sessions[loop][1:]
+
+
+async def session_lifetime(loop, session):
+    """
+    Holds a session open until the event loop shuts down. asyncio.run() closes any unfinished async
+    generators before closing the loop, which runs the finally block and closes the session.
+    :param loop: The event loop the session belongs to
+    :param session: The aiohttp session
+    """
+    try:
+        yield
+    finally:
+        sessions.pop(loop, None)
+        await session.close()
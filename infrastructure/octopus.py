@@ -1,14 +1,24 @@
 import asyncio
+import copy
 import datetime
-import json
+import functools
+import hashlib
+import inspect
+import itertools
+import logging
 import re
+import threading
+import types
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from urllib.parse import urlparse
 
 import aiohttp
+import orjson
 import pytz
-from fuzzywuzzy import fuzz
-from retry import retry
-from urllib3.exceptions import HTTPError
+from expiring_dict import ExpiringDict
+from rapidfuzz import fuzz
+from urllib3.util import make_headers
 
 from domain.config.openai import max_context
 from domain.converters.string_to_int import string_to_int
@@ -19,38 +29,160 @@ from domain.exceptions.space_not_found import SpaceNotFound
 from domain.exceptions.user_not_loggedin import OctopusApiKeyInvalid
 from domain.logging.app_logging import configure_logging
 from domain.query.query_inspector import release_is_latest
-from domain.sanitizers.sanitized_list import get_item_fuzzy, normalize_log_step_name, flatten_list
+from domain.sanitizers.sanitized_list import get_item_fuzzy, normalize_log_step_name
 from domain.sanitizers.url_sanitizer import quote_safe
 from domain.url.build_url import build_url
-from domain.validation.argument_validation import ensure_string_not_empty
-from infrastructure.http_pool import http, TAKE_ALL
+from domain.validation.argument_validation import ensure_string_not_empty, ensure_strings_not_empty
+from infrastructure.http_pool import http, TAKE_ALL, get_session, get_semaphore, retry_policy
 
 logger = configure_logging()
-channel_cache = {}
-tenant_cache = {}
-environment_cache = {}
 
-# Semaphore to limit the number of concurrent requests to GitHub
-sem = asyncio.Semaphore(10)
+# Cache for lookups that rarely change, like space names and the server version, that expires in 5 minutes.
+lookup_cache = ExpiringDict(60 * 5)
 
-# metadata prefix string, used with a regex match
-metadata_prefix = "(\\s*(\\*|-)\\s*)?"
+# Responses to conditional requests, keyed by the URL and hashed API key, holding the ETag and parsed body
+etag_cache = ExpiringDict(60 * 60)
+
+# Large list responses, like the list of all users, are held in the etag_cache for a shorter time, as each API key
+# keeps its own copy
+list_etag_ttl = 60 * 5
+
+# Used by the batched generators to request the next page in the background
+prefetch_executor = ThreadPoolExecutor(max_workers=4)
+
+# Used to run independent cached lookups at the same time
+lookup_executor = ThreadPoolExecutor(max_workers=8)
+
+# Async requests that are currently in flight, keyed by the event loop, URL, and hashed API key
+inflight_requests = {}
+
+# Cached lookups that are currently in progress, keyed by the lookup_cache key, holding a Future with the result
+inflight_lookups = {}
+inflight_lookups_lock = threading.Lock()
+
+# Resources looked up by ID are cached for longer, as the name of a resource can change but its ID can not.
+id_lookup_ttl = 60 * 30
+
+# Lookups that are repeated within a single workflow, but whose results can change at any time, are only cached
+# briefly. Lookups whose results are sent back to the server, like the latest package versions or a runbook's
+# published snapshot, are not cached at all.
+short_lookup_ttl = 60
+
+# Lookups that fail to find a resource are cached for a few seconds, so a repeated request for a misspelled name
+# does not repeat the partial name and fallback requests.
+not_found_ttl = 10
+
+# The names of the arguments that hold an API key. These are hashed before being used in a cache key.
+api_key_arguments = ["api_key", "my_api_key"]
+
+# The number of items requested per page by the batched generators. Most spaces hold fewer resources than this,
+# so a generator usually completes with a single request.
+batch_size = 200
+
+# Matches GitHub metadata lines like "* GitHub Owner: OctopusSamples" in project descriptions and release notes
+github_metadata_re = re.compile(r"(\s*(\*|-)\s*)?github (?P<kind>owner|repo|workflow|run\s?id):(?P<value>.*)",
+                                re.IGNORECASE)
+
+# Matches the path of a GitHub Actions run URL like "/OctopusSamples/OctoPetShop/actions/runs/123"
+github_run_url_re = re.compile(r"/(?P<Owner>[^/]+)/(?P<Repo>[^/]+)/actions/runs/(?P<RunId>[^/]+)")
 
 
 def logging_wrapper(func):
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            print(func.__name__ + " Enter")
+            if debug:
+                logger.debug("%s Enter", func.__name__)
             return func(*args, **kwargs)
         finally:
-            print(func.__name__ + " Exit")
+            if debug:
+                logger.debug("%s Exit", func.__name__)
+
+    return wrapper
+
+
+def cache_lookup(func=None, ttl=None):
+    """
+    Caches the result of a function in the lookup_cache. The cache key is built from the function name and arguments,
+    with any API key replaced by a hash so the same lookup is not shared between different API keys. A ResourceNotFound
+    exception is also cached, for not_found_ttl seconds, and raised again by calls with the same arguments.
+    :param func: The function to cache
+    :param ttl: The number of seconds to cache the result for, overriding the default lookup_cache expiry
+    :return: The wrapped function
+    """
+    if func is None:
+        return functools.partial(cache_lookup, ttl=ttl)
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs).arguments
+        cache_key = (func.__name__,) + tuple(
+            hash_api_key(value) if name in api_key_arguments else value for name, value in arguments.items())
+
+        # A single lookup, as the expiry thread can remove the entry between a membership test and a read
+        try:
+            result = lookup_cache[cache_key]
+        except KeyError:
+            pass
+        else:
+            if isinstance(result, ResourceNotFound):
+                raise copy.copy(result)
+            return result
+
+        # Threads making the same lookup at the same time wait for the result of the first one
+        with inflight_lookups_lock:
+            lookup = inflight_lookups.get(cache_key)
+            waiting = lookup is not None
+            if not waiting:
+                lookup = inflight_lookups[cache_key] = Future()
+
+        if waiting:
+            # Any exception raised by the lookup is raised again in the waiting thread
+            return lookup.result()
+
+        try:
+            result = func(*args, **kwargs)
+            if ttl:
+                lookup_cache.ttl(cache_key, result, ttl)
+            else:
+                lookup_cache[cache_key] = result
+            lookup.set_result(result)
+            return result
+        except ResourceNotFound as ex:
+            # Cache a copy of the exception, as the raised exception holds a reference to the traceback
+            lookup_cache.ttl(cache_key, copy.copy(ex), not_found_ttl)
+            lookup.set_exception(ex)
+            raise
+        except BaseException as ex:
+            lookup.set_exception(ex)
+            raise
+        finally:
+            with inflight_lookups_lock:
+                inflight_lookups.pop(cache_key, None)
 
     return wrapper
 
 
+def hash_api_key(api_key):
+    """
+    Hash an API key so it can be used as a cache key
+    :param api_key: The Octopus API key
+    :return: The hashed API key
+    """
+    if not api_key:
+        return api_key
+
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=32)
 def get_octopus_headers(my_api_key):
     """
-    Build the headers used to make an Octopus API request
+    Build the headers used to make an Octopus API request. The headers are cached per API key, so
+    a read only mapping is returned to prevent callers from modifying the shared copy.
     :param my_api_key: The function used to get the Octopus API key
     :return: The headers required to call the Octopus API
     """
@@ -58,10 +190,12 @@ def get_octopus_headers(my_api_key):
     if my_api_key is None:
         raise ValueError('my_api_key must be the Octopus API key.')
 
-    return {
+    # make_headers only advertises the encodings (e.g. brotli) that can be decoded with the installed packages
+    return types.MappingProxyType({
         "X-Octopus-ApiKey": my_api_key,
         "User-Agent": "OctopusAI",
-    }
+        **make_headers(accept_encoding=True),
+    })
 
 
 @logging_wrapper
@@ -75,14 +209,35 @@ def get_space_first_project_runbook_and_environment(space_id, api_key, url):
     :param url: The Octopus URL
     :return: The first combination of project, runbook, and environment
     """
-    space_first_runbook = next(get_all_runbooks_generator(space_id, api_key, url), None)
-    space_first_project = next(get_projects_generator(space_id, api_key, url), None)
-    space_first_environment = next(get_environments_generator(space_id, api_key, url), None)
+    return asyncio.run(get_space_first_project_runbook_and_environment_async(space_id, api_key, url))
+
+
+async def get_space_first_project_runbook_and_environment_async(space_id, api_key, url):
+    """
+    The async version of get_space_first_project_runbook_and_environment
+    :param space_id: The space ID
+    :param api_key: The API key
+    :param url: The Octopus URL
+    :return: The first combination of project, runbook, and environment
+    """
+    # The dashboard returns the projects and environments in a single request, and is fetched
+    # at the same time as the first runbook and the project it belongs to.
+    dashboard, (space_first_runbook, runbook_project) = await asyncio.gather(
+        get_dashboard_async(space_id, api_key, url),
+        get_first_runbook_and_project_async(space_id, api_key, url))
+    space_first_project = next(iter(dashboard.get("Projects") or []), None)
+    space_first_environment = next(iter(dashboard.get("Environments") or []), None)
+
+    # Fall back to the individual endpoints if the dashboard did not list any projects or environments
+    if not space_first_project or not space_first_environment:
+        projects, environments = await asyncio.gather(get_projects_batch_async(0, 1, space_id, api_key, url),
+                                                      get_environments_batch_async(0, 1, space_id, api_key, url))
+        space_first_project = space_first_project or next(iter(projects), None)
+        space_first_environment = space_first_environment or next(iter(environments), None)
 
     # If there was a runbook, return the runbook, the project it was associated with, and an environment
     if space_first_runbook:
-        project = get_project(space_id, space_first_runbook["ProjectId"], api_key, url)
-        return project, space_first_runbook, space_first_environment
+        return runbook_project, space_first_runbook, space_first_environment
 
     # Otherwise return the project and environment
     if space_first_project and space_first_environment:
@@ -92,7 +247,24 @@ def get_space_first_project_runbook_and_environment(space_id, api_key, url):
     return None, None, None
 
 
+async def get_first_runbook_and_project_async(space_id, api_key, url):
+    """
+    Returns the first runbook in a space and the project that it belongs to
+    :param space_id: The space ID
+    :param api_key: The API key
+    :param url: The Octopus URL
+    :return: The first runbook and its project, or None, None if the space has no runbooks
+    """
+    space_first_runbook = next(iter(await get_all_runbooks_batch_async(0, 1, space_id, api_key, url)), None)
+    if not space_first_runbook:
+        return None, None
+
+    api = build_url(url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(space_first_runbook['ProjectId'])}")
+    return space_first_runbook, await get_json_async(api, api_key)
+
+
 @logging_wrapper
+@cache_lookup
 def get_space_id_and_name_from_name(space_name, my_api_key, my_octopus_api):
     """
     Gets a space ID and actual space name from a name extracted from a query.
@@ -114,55 +286,76 @@ def get_space_id_and_name_from_name(space_name, my_api_key, my_octopus_api):
         return space["Id"], space["Name"]
 
     api = build_url(my_octopus_api, "api/spaces", dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
     json = resp.json()
 
-    filtered_spaces = list(filter(lambda s: s["Name"] == space_name, json["Items"]))
-    if len(filtered_spaces) == 1:
-        return filtered_spaces[0]["Id"], filtered_spaces[0]["Name"]
+    # Scan the spaces once, returning an exact match immediately, or a single case-insensitive match that
+    # ignores surrounding whitespace
+    normalized_space_name = space_name.lower().strip()
+    normalized_matches = []
+    for space in json["Items"]:
+        if space["Name"] == space_name:
+            return space["Id"], space["Name"]
+        if space["Name"].lower().strip() == normalized_space_name:
+            normalized_matches.append(space)
 
-    # try case-insensitive match and stripping and whitespace
-    filtered_spaces = list(filter(lambda s: s["Name"].lower().strip() == space_name.lower().strip(), json["Items"]))
-    if len(filtered_spaces) == 1:
-        return filtered_spaces[0]["Id"], filtered_spaces[0]["Name"]
+    if len(normalized_matches) == 1:
+        return normalized_matches[0]["Id"], normalized_matches[0]["Name"]
 
     raise SpaceNotFound(space_name)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup
 def get_version(octopus_url):
     api = build_url(octopus_url, "api")
-    resp = handle_response(lambda: http.request("GET", api))
+    resp = handle_response("GET", api)
     return resp.json()["Version"]
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_spaces_batch(skip, take, api_key, octopus_url):
     api = build_url(octopus_url, "api/Spaces", dict(take=take, skip=skip))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()["Items"]
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return response_items(resp)
 
 
-@logging_wrapper
-def get_spaces_generator(api_key, octopus_url):
+def get_batches_generator(get_batch, *args):
+    """
+    Yields the items returned by a batch function, one page at a time. While the items in a full page are being
+    consumed, the next page is requested in the background.
+    :param get_batch: The batch function, which accepts skip and take followed by the supplied arguments
+    :param args: The remaining arguments passed to the batch function
+    :return: A generator of the items returned by the batch function
+    """
     skip = 0
-    take = 30
+    take = batch_size
+    batch = get_batch(skip, take, *args)
+    next_batch = None
 
-    while True:
-        batch_spaces = get_spaces_batch(skip, take, api_key, octopus_url)
+    try:
+        while True:
+            # A page with fewer items than were requested is the last page, so there is nothing to prefetch
+            next_batch = prefetch_executor.submit(get_batch, skip + take, take, *args) if len(batch) == take else None
 
-        for space in batch_spaces:
-            yield space
+            yield from batch
 
-        if len(batch_spaces) != take:
-            break
+            if not next_batch:
+                break
 
-        skip += take
+            skip += take
+            batch = next_batch.result()
+    finally:
+        # Don't wait for a prefetched page that will never be consumed
+        if next_batch:
+            next_batch.cancel()
+
+
+@logging_wrapper
+def get_spaces_generator(api_key, octopus_url):
+    yield from get_batches_generator(get_spaces_batch, api_key, octopus_url)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_octopus_project_names_base(space_name, my_api_key, my_octopus_api):
     """
@@ -179,14 +372,30 @@ def get_octopus_project_names_base(space_name, my_api_key, my_octopus_api):
     space_id, actual_space_name = get_space_id_and_name_from_name(space_name, my_api_key, my_octopus_api)
 
     api = build_url(my_octopus_api, f"api/{quote_safe(space_id)}/Projects", dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
     json = resp.json()
-    projects = list(map(lambda p: p["Name"], json["Items"]))
+    projects = [project["Name"] for project in json["Items"]]
 
     return actual_space_name, projects
 
 
+def get_github_metadata(text):
+    """
+    Scans text such as a project description or release notes for GitHub metadata lines like
+    "GitHub Owner: OctopusSolutionsEngineering". The first value found for each kind of metadata is kept.
+    :param text: The text to scan
+    :return: A dict mapping the lowercase metadata kind (owner, repo, workflow, runid) to its value
+    """
+    metadata = {}
+    for line in text.split("\n") if text else []:
+        match = github_metadata_re.match(line)
+        if match:
+            metadata.setdefault("".join(match.group("kind").lower().split()), match.group("value").strip())
+
+    return metadata
+
+
 @logging_wrapper
 def get_project_github_workflow(space_id, project_id, my_api_key, my_octopus_api):
     """
@@ -203,22 +412,11 @@ def get_project_github_workflow(space_id, project_id, my_api_key, my_octopus_api
     ensure_string_not_empty(my_octopus_api, 'my_octopus_api must not be empty (get_project_github_workflow).')
 
     project = get_project(space_id, project_id, my_api_key, my_octopus_api)
-    description = project["Description"].split("\n") if project["Description"] else []
-    owner = next(
-        map(
-            lambda x: re.sub(f"{metadata_prefix}github owner:", "", x, flags=re.IGNORECASE).strip(),
-            filter(lambda x: re.match(f"{metadata_prefix}github owner:", x, flags=re.IGNORECASE), description)),
-        None)
-    repo = next(
-        map(
-            lambda x: re.sub(f"{metadata_prefix}github repo:", "", x, flags=re.IGNORECASE).strip(),
-            filter(lambda x: re.match(f"{metadata_prefix}github repo:", x, flags=re.IGNORECASE), description)),
-        None)
-    workflow = next(
-        map(
-            lambda x: re.sub(f"{metadata_prefix}github workflow:", "", x, flags=re.IGNORECASE).strip(),
-            filter(lambda x: re.match(f"{metadata_prefix}github workflow:", x, flags=re.IGNORECASE), description)),
-        None)
+    metadata = get_github_metadata(project["Description"])
+
+    owner = metadata.get("owner")
+    repo = metadata.get("repo")
+    workflow = metadata.get("workflow")
 
     if owner and repo and workflow:
         return {"ProjectId": project_id, "Owner": owner, "Repo": repo, "Workflow": workflow}
@@ -243,42 +441,22 @@ async def get_release_github_workflow_async(space_id, release_id, my_api_key, my
 
 
 def get_release_github_workflow_from_buildinfo(release_id, release):
-    # Get the build url and the package ID
-    urls = filter(lambda x: x.get("BuildUrl"),
-                  map(lambda x: {"BuildUrl": x.get("BuildUrl"), "PackageId": x.get("PackageId")},
-                      release.get("BuildInformation", [])))
     # Keep the package ID and those with a build URL that matches the known github runs url
-    workflows = filter(lambda x: x.get("Match"),
-                       map(lambda x: {"PackageId": x.get("PackageId"),
-                                      "Match": re.match(
-                                          "/(?P<Owner>[^/]+)/(?P<Repo>[^/]+)/actions/runs/(?P<RunId>[^/]+)",
-                                          urlparse(x.get("BuildUrl")).path)}, urls))
-    # Extract all the useful values and return them in a map
-    return list(
-        map(lambda x: {"ReleaseId": release_id,
-                       "PackageId": x.get("PackageId"),
-                       "Owner": x["Match"].group("Owner"),
-                       "Repo": x["Match"].group("Repo"),
-                       "RunId": x["Match"].group("RunId")}, workflows))
+    return [{"ReleaseId": release_id,
+             "PackageId": build_info.get("PackageId"),
+             "Owner": match.group("Owner"),
+             "Repo": match.group("Repo"),
+             "RunId": match.group("RunId")}
+            for build_info in release.get("BuildInformation", [])
+            if build_info.get("BuildUrl") and (match := github_run_url_re.match(urlparse(build_info["BuildUrl"]).path))]
 
 
 def get_release_github_workflow_from_desc(release_id, release):
-    description = release["ReleaseNotes"].split("\n") if release["ReleaseNotes"] else []
-    owner = next(
-        map(
-            lambda x: re.sub(f"{metadata_prefix}github owner:", "", x, flags=re.IGNORECASE).strip(),
-            filter(lambda x: re.match(f"{metadata_prefix}github owner:", x, flags=re.IGNORECASE), description)),
-        None)
-    repo = next(
-        map(
-            lambda x: re.sub(f"{metadata_prefix}?github repo:", "", x, flags=re.IGNORECASE).strip(),
-            filter(lambda x: re.match(f"{metadata_prefix}github repo:", x, flags=re.IGNORECASE), description)),
-        None)
-    run_id = next(
-        map(
-            lambda x: re.sub(f"{metadata_prefix}github run\\s?id:", "", x, flags=re.IGNORECASE).strip(),
-            filter(lambda x: re.match(f"{metadata_prefix}github run\\s?id:", x, flags=re.IGNORECASE), description)),
-        None)
+    metadata = get_github_metadata(release["ReleaseNotes"])
+
+    owner = metadata.get("owner")
+    repo = metadata.get("repo")
+    run_id = metadata.get("runid")
 
     if owner and repo and run_id:
         return [
@@ -287,7 +465,6 @@ def get_release_github_workflow_from_desc(release_id, release):
     return []
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_dashboard(space_id, my_api_key, my_octopus_api):
     """
@@ -304,12 +481,30 @@ def get_dashboard(space_id, my_api_key, my_octopus_api):
 
     api = build_url(my_octopus_api, f"api/{quote_safe(space_id)}/Dashboard",
                     dict(highestLatestVersionPerProjectAndEnvironment="true"))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
     return resp.json()
 
 
-@retry(HTTPError, tries=3, delay=2)
+async def get_dashboard_async(space_id, my_api_key, my_octopus_api):
+    """
+    The async version of get_dashboard
+    :param space_id: The id of the Octopus space containing the projects
+    :param my_api_key: The Octopus API key
+    :param my_octopus_api: The Octopus URL
+    :return: The dashboard summary
+    """
+
+    ensure_string_not_empty(space_id, 'space_id must be a non-empty string (get_dashboard_async).')
+    ensure_string_not_empty(my_octopus_api, 'my_octopus_api must be the Octopus Url (get_dashboard_async).')
+    ensure_string_not_empty(my_api_key, 'my_api_key must be the Octopus Api key (get_dashboard_async).')
+
+    api = build_url(my_octopus_api, f"api/{quote_safe(space_id)}/Dashboard",
+                    dict(highestLatestVersionPerProjectAndEnvironment="true"))
+
+    return await get_json_async(api, my_api_key)
+
+
 @logging_wrapper
 def get_project_tenant_dashboard(space_id, project_id, my_api_key, my_octopus_api):
     """
@@ -329,12 +524,11 @@ def get_project_tenant_dashboard(space_id, project_id, my_api_key, my_octopus_ap
     api = build_url(my_octopus_api,
                     f"bff/spaces/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/tenanted-dashboard",
                     dict(showAll="true", skip=0, take=30))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
     return resp.json()
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_runbooks_dashboard(space_id, runbook_id, my_api_key, my_octopus_api):
     """
@@ -352,12 +546,13 @@ def get_runbooks_dashboard(space_id, runbook_id, my_api_key, my_octopus_api):
     ensure_string_not_empty(my_api_key, 'my_api_key must be the Octopus Api key (get_runbooks_dashboard).')
 
     api = build_url(my_octopus_api, f"api/{quote_safe(space_id)}/progression/runbooks/{quote_safe(runbook_id)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
     return resp.json()
 
 
 @logging_wrapper
+@cache_lookup
 def get_current_user(my_api_key, my_octopus_api):
     """
     Returns the ID of the octopus user. This can be used to verify an API key, as even Octopus users with
@@ -370,14 +565,13 @@ def get_current_user(my_api_key, my_octopus_api):
     ensure_string_not_empty(my_api_key, 'my_api_key must be the Octopus Api key (get_current_user).')
 
     api = build_url(my_octopus_api, "/api/users/me")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
     json = resp.json()
     return json["Id"]
 
 
 @logging_wrapper
-@retry(HTTPError, tries=3, delay=2)
 def get_projects(space_id, my_api_key, my_octopus_api):
     """
     Returns the projects in a space
@@ -390,10 +584,9 @@ def get_projects(space_id, my_api_key, my_octopus_api):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_projects).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Projects", query=dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -409,10 +602,9 @@ def get_feeds(my_api_key, my_octopus_api, space_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_feeds).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Feeds", query=dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -428,10 +620,9 @@ def get_accounts(my_api_key, my_octopus_api, space_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_accounts).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Accounts", query=dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -447,10 +638,9 @@ def get_machines(my_api_key, my_octopus_api, space_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_machines).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Machines", query=dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -466,10 +656,9 @@ def get_certificates(my_api_key, my_octopus_api, space_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_certificates).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Certificates", query=dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -485,10 +674,9 @@ def get_environments(my_api_key, my_octopus_api, space_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_environments).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Environments", query=dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -504,10 +692,9 @@ def get_tenants(my_api_key, my_octopus_api, space_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_environments).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Tenants", query=dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -523,10 +710,9 @@ def get_project_channel(my_api_key, my_octopus_api, space_id, project_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_project_channel).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Channels")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
-    json = resp.json()
-    return json["Items"]
+    return response_items(resp)
 
 
 @logging_wrapper
@@ -542,7 +728,7 @@ def get_lifecycle(my_api_key, my_octopus_api, space_id, lifecycle_id):
     ensure_string_not_empty(space_id, 'space_id must be the space ID (get_lifecycle).')
 
     api = build_url(my_octopus_api, f"/api/{quote_safe(space_id)}/Lifecycles/{quote_safe(lifecycle_id)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(my_api_key))
 
     json = resp.json()
     return json
@@ -570,7 +756,7 @@ def create_limited_api_key(user, my_api_key, my_octopus_api):
     }
 
     api = build_url(my_octopus_api, f"/api/users/{quote_safe(user)}/apikeys")
-    resp = handle_response(lambda: http.request("POST", api, json=api_key, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("POST", api, json=api_key, headers=get_octopus_headers(my_api_key))
 
     json = resp.json()
     return json["ApiKey"]
@@ -598,13 +784,12 @@ def create_unlimited_api_key(user, my_api_key, my_octopus_api):
     }
 
     api = build_url(my_octopus_api, f"/api/users/{quote_safe(user)}/apikeys")
-    resp = handle_response(lambda: http.request("POST", api, json=api_key, headers=get_octopus_headers(my_api_key)))
+    resp = handle_response("POST", api, json=api_key, headers=get_octopus_headers(my_api_key))
 
     json = resp.json()
     return json["ApiKey"]
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_raw_deployment_process(space_name, project_name, api_key, octopus_url):
     """
@@ -623,12 +808,11 @@ def get_raw_deployment_process(space_name, project_name, api_key, octopus_url):
     project = get_project(space_id, project_name, api_key, octopus_url)
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project['Id'])}/DeploymentProcesses")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
     return resp.data.decode("utf-8")
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_project_progression(space_name, project_name, api_key, octopus_url):
     """
@@ -647,140 +831,93 @@ def get_project_progression(space_name, project_name, api_key, octopus_url):
     project = get_project(space_id, project_name, api_key, octopus_url)
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project['Id'])}/Progression")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
     return resp.json()
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_projects_batch(skip, take, space_id, api_key, octopus_url):
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects", dict(take=take, skip=skip))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()["Items"]
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return response_items(resp)
 
 
-@logging_wrapper
-def get_projects_generator(space_id, api_key, octopus_url):
-    skip = 0
-    take = 30
-
-    while True:
-        batch_projects = get_projects_batch(skip, take, space_id, api_key, octopus_url)
-
-        for project in batch_projects:
-            yield project
+async def get_projects_batch_async(skip, take, space_id, api_key, octopus_url):
+    api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects", dict(take=take, skip=skip))
+    resp = await get_json_async(api, api_key)
+    return resp["Items"]
 
-        if len(batch_projects) != take:
-            break
 
-        skip += take
+@logging_wrapper
+def get_projects_generator(space_id, api_key, octopus_url):
+    yield from get_batches_generator(get_projects_batch, space_id, api_key, octopus_url)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_environments_batch(skip, take, space_id, api_key, octopus_url):
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Environments", dict(take=take, skip=skip))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()["Items"]
-
-
-@logging_wrapper
-def get_environments_generator(space_id, api_key, octopus_url):
-    skip = 0
-    take = 30
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return response_items(resp)
 
-    while True:
-        batch_environments = get_environments_batch(skip, take, space_id, api_key, octopus_url)
 
-        for environment in batch_environments:
-            yield environment
+async def get_environments_batch_async(skip, take, space_id, api_key, octopus_url):
+    api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Environments", dict(take=take, skip=skip))
+    resp = await get_json_async(api, api_key)
+    return resp["Items"]
 
-        if len(batch_environments) != take:
-            break
 
-        skip += take
+@logging_wrapper
+def get_environments_generator(space_id, api_key, octopus_url):
+    yield from get_batches_generator(get_environments_batch, space_id, api_key, octopus_url)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_tenants_batch(skip, take, space_id, api_key, octopus_url):
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Tenants", dict(take=take, skip=skip))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()["Items"]
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return response_items(resp)
 
 
 @logging_wrapper
 def get_tenants_generator(space_id, api_key, octopus_url):
-    skip = 0
-    take = 30
-
-    while True:
-        batch_tenants = get_tenants_batch(skip, take, space_id, api_key, octopus_url)
-
-        for tenant in batch_tenants:
-            yield tenant
-
-        if len(batch_tenants) != take:
-            break
-
-        skip += take
+    yield from get_batches_generator(get_tenants_batch, space_id, api_key, octopus_url)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_runbooks_batch(skip, take, space_id, project_id, api_key, octopus_url):
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Runbooks",
                     dict(take=take, skip=skip))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()["Items"]
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return response_items(resp)
 
 
 @logging_wrapper
 def get_runbooks_generator(space_id, project_id, api_key, octopus_url):
-    skip = 0
-    take = 30
-
-    while True:
-        batch_runbooks = get_runbooks_batch(skip, take, space_id, project_id, api_key, octopus_url)
-
-        for tenant in batch_runbooks:
-            yield tenant
+    yield from get_batches_generator(get_runbooks_batch, space_id, project_id, api_key, octopus_url)
 
-        if len(batch_runbooks) != take:
-            break
 
-        skip += take
-
-
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_all_runbooks_batch(skip, take, space_id, api_key, octopus_url):
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Runbooks",
                     dict(take=take, skip=skip))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()["Items"]
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return response_items(resp)
 
 
-@logging_wrapper
-def get_all_runbooks_generator(space_id, api_key, octopus_url):
-    skip = 0
-    take = 30
-
-    while True:
-        batch_runbooks = get_all_runbooks_batch(skip, take, space_id, api_key, octopus_url)
-
-        for tenant in batch_runbooks:
-            yield tenant
+async def get_all_runbooks_batch_async(skip, take, space_id, api_key, octopus_url):
+    api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Runbooks", dict(take=take, skip=skip))
+    resp = await get_json_async(api, api_key)
+    return resp["Items"]
 
-        if len(batch_runbooks) != take:
-            break
 
-        skip += take
+@logging_wrapper
+def get_all_runbooks_generator(space_id, api_key, octopus_url):
+    yield from get_batches_generator(get_all_runbooks_batch, space_id, api_key, octopus_url)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup(ttl=id_lookup_ttl)
 def get_space(space_id, api_key, octopus_url):
     """
     Returns a space resource from the id
@@ -797,12 +934,11 @@ def get_space(space_id, api_key, octopus_url):
     base_url = f"api/Spaces/{quote_safe(space_id)}"
 
     api = build_url(octopus_url, base_url)
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()
+    return get_json_conditional(api, api_key)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup
 def get_project(space_id, project_name, api_key, octopus_url):
     """
     Returns a project resource from the name
@@ -819,27 +955,13 @@ def get_project(space_id, project_name, api_key, octopus_url):
     if project_name.startswith("Projects-"):
         base_url = f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_name)}"
         api = build_url(octopus_url, base_url)
-        resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-        return resp.json()
-
-    base_url = f"api/{quote_safe(space_id)}/Projects"
+        return get_json_conditional(api, api_key)
 
-    api = build_url(octopus_url, base_url, dict(partialname=project_name))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    project = get_item_fuzzy(resp.json()["Items"], project_name)
+    return get_resource_fuzzy(f"api/{quote_safe(space_id)}/Projects", "Project", project_name, api_key, octopus_url)
 
-    if project is None:
-        api = build_url(octopus_url, base_url, dict(take=TAKE_ALL))
-        resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-        project = get_item_fuzzy(resp.json()["Items"], project_name)
-        if project is None:
-            raise ResourceNotFound("Project", project_name)
 
-    return project
-
-
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup(ttl=id_lookup_ttl)
 def get_environment(space_id, environment_id, api_key, octopus_url):
     """
     Returns a environment resource from the id
@@ -855,11 +977,9 @@ def get_environment(space_id, environment_id, api_key, octopus_url):
     base_url = f"api/{quote_safe(space_id)}/Environments/{quote_safe(environment_id)}"
 
     api = build_url(octopus_url, base_url)
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()
+    return get_json_conditional(api, api_key)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_project_releases(space_id, project_id, api_key, octopus_url, take=max_context):
     """
@@ -875,12 +995,11 @@ def get_project_releases(space_id, project_id, api_key, octopus_url, take=max_co
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Releases",
                     query=dict(take=take))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
-    return resp.json()
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_release_deployments(space_id, release_id, api_key, octopus_url):
     """
@@ -895,13 +1014,13 @@ def get_release_deployments(space_id, release_id, api_key, octopus_url):
     ensure_string_not_empty(release_id, 'release_id must be a non-empty string (get_release_deployments).')
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Releases/{quote_safe(release_id)}/Deployments")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
-    return resp.json()
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup(ttl=id_lookup_ttl)
 def get_release(space_id, release_id, api_key, octopus_url):
     """
     Returns the  release.
@@ -915,12 +1034,11 @@ def get_release(space_id, release_id, api_key, octopus_url):
     ensure_string_not_empty(release_id, 'release_id must be a non-empty string (get_release_deployments).')
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Releases/{quote_safe(release_id)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
-    return resp.json()
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_task(space_id, task_id, api_key, octopus_url):
     """
@@ -937,12 +1055,11 @@ def get_task(space_id, task_id, api_key, octopus_url):
         return None
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Tasks/{quote_safe(task_id)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
-    return resp.json()
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 async def get_task_details_async(space_id, task_id, api_key, octopus_url):
     """
@@ -959,14 +1076,9 @@ async def get_task_details_async(space_id, task_id, api_key, octopus_url):
         return None
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Tasks/{quote_safe(task_id)}/details")
-
-    async with sem:
-        async with aiohttp.ClientSession(headers=get_octopus_headers(api_key)) as session:
-            async with session.get(str(api)) as response:
-                return await response.json()
+    return await get_json_async(api, api_key)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_project_progression_from_ids(space_id, project_id, api_key, octopus_url):
     """
@@ -981,12 +1093,11 @@ def get_project_progression_from_ids(space_id, project_id, api_key, octopus_url)
     ensure_string_not_empty(project_id, 'project_id must be a non-empty string (get_project_progression_from_ids).')
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Progression")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
-    return resp.json()
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_deployment_status_base(space_name, environment_name, project_name, api_key, octopus_url):
     """
@@ -1014,16 +1125,16 @@ def get_deployment_status_base(space_name, environment_name, project_name, api_k
     environment = get_environment_fuzzy(space_id, environment_name, api_key, octopus_url)
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project['Id'])}/Progression")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    releases = list(filter(lambda r: environment["Id"] in r["Deployments"], resp.json()["Releases"]))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    # Stop at the first release that was deployed to the environment
+    release = next((r for r in orjson.loads(resp.data)["Releases"] if environment["Id"] in r["Deployments"]), None)
 
-    if len(releases) == 0:
+    if not release:
         raise ResourceNotFound("Deployment", f"{project_name} in {environment_name}")
 
-    return actual_space_name, environment['Name'], project['Name'], releases[0]["Deployments"][environment['Id']][0]
+    return actual_space_name, environment['Name'], project['Name'], release["Deployments"][environment['Id']][0]
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_deployment_logs(space_name, project_name, environment_name, tenant_name, release_version,
                         api_key,
@@ -1048,74 +1159,136 @@ def get_deployment_logs(space_name, project_name, environment_name, tenant_name,
 
     project = get_project(space_id, project_name, api_key, octopus_url)
 
-    environment = None
-    if environment_name:
-        environment = get_environment_fuzzy(space_id, environment_name, api_key, octopus_url)
-
-    tenant = None
-    if tenant_name:
-        tenant = get_tenant_fuzzy(space_id, tenant_name, api_key, octopus_url)
-
     # Find deployment count
     # api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Deployments", dict(take=0, projects=project['Id']))
-    # resp_json = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key))).json()
+    # resp_json = handle_response("GET", api, headers=get_octopus_headers(api_key)).json()
     # total_results = resp_json["TotalResults"]
     # skip = max(0, total_results - 30)
 
-    # Get the latest deployments
-    api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Deployments",
-                    dict(take=100, skip=0, projects=project['Id']))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-
-    deployments = json.loads(resp.data.decode("utf-8")).get("Items")
+    # The environment, tenant, and latest deployments are independent, so they are requested concurrently. When the
+    # latest release is requested, the latest releases are also fetched, as they usually include the release of the
+    # latest deployment.
+    environment, tenant, deployments, latest_releases = asyncio.run(
+        get_deployment_logs_resources_async(space_id, project['Id'], environment_name, tenant_name,
+                                            release_is_latest(release_version), api_key, octopus_url))
 
-    if environment:
-        # Only releases to the environment are a candidate
-        deployments = list(filter(lambda d: d["EnvironmentId"] == environment["Id"], deployments))
-
-    if tenant:
-        deployments = list(filter(lambda d: d["TenantId"] == tenant["Id"], deployments))
+    # Only deployments to the environment and tenant are a candidate
+    environment_id = environment["Id"] if environment else None
+    tenant_id = tenant["Id"] if tenant else None
+    deployments = [d for d in deployments if
+                   (environment_id is None or d["EnvironmentId"] == environment_id)
+                   and (tenant_id is None or d["TenantId"] == tenant_id)]
 
     task_id = None
     actual_release_version = None
     if release_is_latest(release_version):
         if deployments:
             task_id = deployments[0]["TaskId"]
-            release = get_release(space_id, deployments[0]["ReleaseId"], api_key, octopus_url)
+            release = next((r for r in latest_releases if r["Id"] == deployments[0]["ReleaseId"]), None)
+            if not release:
+                release = get_release(space_id, deployments[0]["ReleaseId"], api_key, octopus_url)
             actual_release_version = release["Version"]
     else:
         # We need to match the release version to a release, and the release to a deployment
 
-        # Start by getting the releases for a project
-        api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project['Id'])}/Releases",
-                        dict(take=100))
-        resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-        releases = json.loads(resp.data.decode("utf-8")).get("Items")
+        # Start by searching the project releases for the version, which is a partial match done by the server
+        releases_url = f"api/{quote_safe(space_id)}/Projects/{quote_safe(project['Id'])}/Releases"
+        api = build_url(octopus_url, releases_url, dict(searchByVersion=release_version.strip(), take=5))
+        resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+        releases = orjson.loads(resp.data).get("Items")
 
         # Find the specific release
         release = next(filter(lambda r: r["Version"] == release_version.strip(), releases), None)
 
+        # Fall back to scanning the latest releases for a project
+        if not release:
+            api = build_url(octopus_url, releases_url, dict(take=100))
+            resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+            releases = orjson.loads(resp.data).get("Items")
+            release = next(filter(lambda r: r["Version"] == release_version.strip(), releases), None)
+
         # If the release is not found, exit
         if not release:
             return None, None
 
         # Find the specific deployment
         actual_release_version = release["Version"]
-        specific_deployment = list(filter(lambda d: d["ReleaseId"] == release["Id"], deployments))
+        specific_deployment = next((d for d in deployments if d["ReleaseId"] == release["Id"]), None)
         if specific_deployment:
-            task_id = specific_deployment[0]["TaskId"]
+            task_id = specific_deployment["TaskId"]
 
     if not task_id:
         return None, None
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Tasks/{task_id}/details")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    task = json.loads(resp.data.decode("utf-8"))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    task = orjson.loads(resp.data)
 
     return task["Task"], task["ActivityLogs"], actual_release_version
 
 
-@retry(HTTPError, tries=3, delay=2)
+async def get_deployment_logs_resources_async(space_id, project_id, environment_name, tenant_name,
+                                              include_releases, api_key, octopus_url):
+    """
+    Concurrently looks up the environment, tenant, latest deployments, and latest releases used to find deployment logs
+    :param space_id: The ID of the space
+    :param project_id: The ID of the project
+    :param environment_name: The optional name of the environment
+    :param tenant_name: The optional name of the tenant
+    :param include_releases: True if the latest releases of the project are to be returned
+    :param api_key: The Octopus API key
+    :param octopus_url: The Octopus URL
+    :return: The environment (or None), the tenant (or None), the latest deployments, and the latest releases
+    """
+    deployments_api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Deployments",
+                                dict(take=100, skip=0, projects=project_id))
+    releases_api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Releases",
+                             dict(take=30))
+
+    lookups = [get_json_async(deployments_api, api_key)]
+    if include_releases:
+        lookups.append(get_json_async(releases_api, api_key))
+    if environment_name:
+        lookups.append(get_environment_fuzzy_async(space_id, environment_name, api_key, octopus_url))
+    if tenant_name:
+        lookups.append(get_tenant_fuzzy_async(space_id, tenant_name, api_key, octopus_url))
+
+    results = iter(await asyncio.gather(*lookups))
+    deployments = next(results)
+    releases = next(results) if include_releases else None
+    environment = next(results) if environment_name else None
+    tenant = next(results) if tenant_name else None
+
+    return environment, tenant, deployments.get("Items"), releases.get("Items") if releases else []
+
+
+async def get_runbook_deployment_logs_resources_async(space_id, project_id, runbook_name, environment_name,
+                                                      tenant_name, api_key, octopus_url):
+    """
+    Concurrently looks up the runbook, environment, and tenant used to find runbook run logs
+    :param space_id: The ID of the space
+    :param project_id: The ID of the project
+    :param runbook_name: The name of the runbook
+    :param environment_name: The optional name of the environment
+    :param tenant_name: The optional name of the tenant
+    :param api_key: The Octopus API key
+    :param octopus_url: The Octopus URL
+    :return: The runbook, the environment (or None), and the tenant (or None)
+    """
+    lookups = [get_runbook_fuzzy_async(space_id, project_id, runbook_name, api_key, octopus_url)]
+    if environment_name:
+        lookups.append(get_environment_fuzzy_async(space_id, environment_name, api_key, octopus_url))
+    if tenant_name:
+        lookups.append(get_tenant_fuzzy_async(space_id, tenant_name, api_key, octopus_url))
+
+    results = iter(await asyncio.gather(*lookups))
+    runbook = next(results)
+    environment = next(results) if environment_name else None
+    tenant = next(results) if tenant_name else None
+
+    return runbook, environment, tenant
+
+
 @logging_wrapper
 def get_runbook_deployment_logs(space_name, project_name, runbook_name, environment_name, tenant_name, api_key,
                                 octopus_url):
@@ -1140,19 +1313,13 @@ def get_runbook_deployment_logs(space_name, project_name, runbook_name, environm
 
     project = get_project(space_id, project_name, api_key, octopus_url)
 
-    runbook = get_runbook_fuzzy(space_id, project["Id"], runbook_name, api_key, octopus_url)
-
-    environment = None
-    if environment_name:
-        environment = get_environment_fuzzy(space_id, environment_name, api_key, octopus_url)
-
-    tenant = None
-    if tenant_name:
-        tenant = get_tenant_fuzzy(space_id, tenant_name, api_key, octopus_url)
+    # The runbook, environment, and tenant are independent, so they are requested concurrently
+    runbook, environment, tenant = asyncio.run(
+        get_runbook_deployment_logs_resources_async(space_id, project['Id'], runbook_name, environment_name,
+                                                    tenant_name, api_key, octopus_url))
 
     # Find deployment count
-    query = dict(skip=0, project=project['Id'], runbook=runbook["Id"], spaces=space_id,
-                 includeSystem="false", environment=environment["Id"])
+    query = dict(skip=0, project=project['Id'], runbook=runbook["Id"], spaces=space_id, includeSystem="false")
 
     if environment:
         query["environment"] = environment["Id"]
@@ -1161,8 +1328,8 @@ def get_runbook_deployment_logs(space_name, project_name, runbook_name, environm
         query["tenant"] = tenant["Id"]
 
     api = build_url(octopus_url, f"bff/tasks/list", query)
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    runs = json.loads(resp.data.decode("utf-8")).get("Items")
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    runs = orjson.loads(resp.data).get("Items")
 
     if not runs:
         return ""
@@ -1170,8 +1337,8 @@ def get_runbook_deployment_logs(space_name, project_name, runbook_name, environm
     task_id = runs[0]["Id"] if runs else None
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Tasks/{task_id}/details")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    task = json.loads(resp.data.decode("utf-8"))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    task = orjson.loads(resp.data)
 
     return task["ActivityLogs"]
 
@@ -1180,31 +1347,49 @@ def activity_logs_to_string(activity_logs, sanitized_steps=None, categories=None
     if not activity_logs:
         return ""
 
-    logs = flatten_list(get_logs(i, 0, sanitized_steps, categories, include_name) for i in activity_logs)
-    return join_string.join(logs)
+    # The steps are normalized once here rather than for every log item they are compared to
+    steps = prepare_log_steps(sanitized_steps)
+    return join_string.join(
+        itertools.chain.from_iterable(get_logs(i, 0, steps, categories, include_name) for i in activity_logs))
+
+
+def prepare_log_steps(steps):
+    """
+    Prepares the steps used to filter logs
+    :param steps: The list of step indexes or names to filter the logs by
+    :return: A list of tuples holding the step, its normalized name, and whether it is a step index
+    """
+    return [(step, normalize_log_step_name(step), bool(string_to_int(step))) for step in steps or []]
 
 
 def get_logs(log_item, depth, steps=None, categories=None, include_name=True):
     if depth == 0 and len(log_item["LogElements"]) == 0 and len(log_item["Children"]) == 0:
         return [f"No logs found (status: {log_item['Status']})."] if not categories else []
 
-    filtered_logs = filter(lambda x: x["Category"] in categories, log_item["LogElements"]) if categories else log_item[
-        "LogElements"]
-
+    message_text = itemgetter("MessageText")
     logs = []
 
-    if include_name:
-        logs.append(log_item["Name"])
+    # Walk the log tree depth first. Children are pushed in reverse so they are popped in their original order.
+    stack = [(log_item, depth)]
+    while stack:
+        item, item_depth = stack.pop()
+        log_elements = item["LogElements"]
+        children = item["Children"]
 
-    logs.extend(list(map(lambda e: e["MessageText"], filtered_logs)))
+        if include_name:
+            logs.append(item["Name"])
 
-    # limit the result to either step indexes or names
-    if depth == 1 and not filter_logs(log_item, steps):
-        return logs
+        if categories:
+            log_elements = [element for element in log_elements if element["Category"] in categories]
 
-    if log_item["Children"]:
-        for child in log_item["Children"]:
-            logs.extend(get_logs(child, depth + 1, steps, categories, include_name))
+        logs.extend(map(message_text, log_elements))
+
+        # limit the result to either step indexes or names
+        if item_depth == 1 and not filter_logs(item, steps):
+            continue
+
+        if children:
+            stack.extend((child, item_depth + 1) for child in reversed(children))
 
     return logs
 
@@ -1213,64 +1398,229 @@ def filter_logs(log_item, steps):
     """
     Determines if the current step should be included in the logs
     :param log_item: The current log item to be serialized to a string
-    :param steps: The list of steps to filter the logs by
+    :param steps: The list of steps to filter the logs by, as returned by prepare_log_steps
     :return: True if the current step should be included in the logs, False otherwise
     """
     step_name_match_ratio = 80
 
-    if not steps or len(steps) == 0:
+    if not steps:
         return True
 
-    step_ints = [step for step in steps if string_to_int(step)]
     # Find the logs by index
-    found_index = step_ints and len(step_ints) != 0 and any(
-        filter(lambda step_int: log_item["Name"].startswith("Step " + step_int), step_ints))
-
-    # Find the logs by name
-    found_name = any(filter(lambda step: fuzz.ratio(normalize_log_step_name(step),
-                                                    normalize_log_step_name(log_item["Name"])) >= step_name_match_ratio,
-                            steps))
-
-    # If none match, don't dig deeper
-    if not found_index and not found_name:
-        return False
+    log_item_name = log_item["Name"]
+    if any(is_index and log_item_name.startswith("Step " + step) for step, _, is_index in steps):
+        return True
 
-    return True
+    # Find the logs by name. The score cutoff allows rapidfuzz to stop scoring a step early once it can no longer match.
+    normalized_log_item_name = normalize_log_step_name(log_item_name)
+    return any(fuzz.ratio(normalized_step, normalized_log_item_name,
+                          score_cutoff=step_name_match_ratio) >= step_name_match_ratio
+               for _, normalized_step, _ in steps)
 
 
-def handle_response(callback):
+def handle_response(method, url, *, headers=None, json=None, body=None):
     """
-    This function maps common HTTP response codes to exceptions
-    :param callback: A function that returns a response object
+    This function makes a HTTP request and maps common HTTP response codes to exceptions
+    :param method: The HTTP method
+    :param url: The URL to request
+    :param headers: The request headers
+    :param json: An optional object to send as the JSON request body
+    :param body: An optional raw request body
     :return: The response object
     """
-    response = callback()
+    # orjson serializes straight to bytes, which is faster than urllib3's use of the standard json module
+    if json is not None:
+        body = orjson.dumps(json)
+        headers = {**(headers or {}), "Content-Type": "application/json"}
+
+    response = http.request(method, url, headers=headers, body=body, retries=retry_policy)
     if response.status == 401:
         logger.info(response.data.decode('utf-8'))
         raise OctopusApiKeyInvalid()
-    if response.status != 200 and response.status != 201:
+    # 304 is returned when a conditional request matches the cached ETag
+    if response.status != 200 and response.status != 201 and response.status != 304:
         logger.info(response.data.decode('utf-8'))
         raise OctopusRequestFailed(f"Request failed with " + response.data.decode('utf-8'))
 
     return response
 
 
-@retry(HTTPError, tries=3, delay=2)
+def get_json_conditional(api, api_key, ttl=None):
+    """
+    Makes a GET request to the Octopus API, caching the response against its ETag. When a response has been cached,
+    the request includes an If-None-Match header, and the cached response is returned if the server responds with
+    304 Not Modified.
+    :param api: The URL to request
+    :param api_key: The Octopus API key
+    :param ttl: The number of seconds to cache the response for, overriding the default etag_cache expiry
+    :return: The parsed JSON response
+    """
+    cache_key = (str(api), hash_api_key(api_key))
+    cached = etag_cache.get(cache_key)
+
+    headers = get_octopus_headers(api_key)
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
+
+    resp = handle_response("GET", api, headers=headers)
+    if resp.status == 304 and cached:
+        return cached[1]
+
+    body = orjson.loads(resp.data)
+    etag = resp.headers.get("ETag")
+    if etag:
+        if ttl:
+            etag_cache.ttl(cache_key, (etag, body), ttl)
+        else:
+            etag_cache[cache_key] = (etag, body)
+
+    return body
+
+
+def response_items(response):
+    """
+    Returns the items from a paged Octopus API response. orjson is used to parse the response body,
+    as list endpoints can return large payloads.
+    :param response: The response object
+    :return: The items in the response
+    """
+    return orjson.loads(response.data)["Items"]
+
+
+async def get_json_async(api, api_key):
+    """
+    Makes an async GET request to the Octopus API, mapping common HTTP response codes to exceptions.
+    Concurrent requests for the same URL with the same API key share a single HTTP request.
+    :param api: The URL to request
+    :param api_key: The Octopus API key
+    :return: The parsed JSON response
+    """
+    loop = asyncio.get_running_loop()
+    request_key = (loop, str(api), hash_api_key(api_key))
+
+    if request_key not in inflight_requests:
+        request = loop.create_task(request_json_async(api, api_key))
+        request.add_done_callback(lambda _: inflight_requests.pop(request_key, None))
+        inflight_requests[request_key] = request
+
+    # Shield the shared request so cancelling one caller does not cancel it for the others
+    return await asyncio.shield(inflight_requests[request_key])
+
+
+async def request_json_async(api, api_key):
+    """
+    Makes an async GET request to the Octopus API, mapping common HTTP response codes to exceptions. Connection errors
+    and transient failures are retried using the same policy as the synchronous requests.
+    :param api: The URL to request
+    :param api_key: The Octopus API key
+    :return: The parsed JSON response
+    """
+    session = await get_session()
+    semaphore = await get_semaphore()
+    retry = retry_policy
+
+    while True:
+        try:
+            async with semaphore:
+                async with session.get(str(api), headers=get_octopus_headers(api_key)) as response:
+                    if retry.total and retry.is_retry("GET", response.status, "Retry-After" in response.headers):
+                        retry = retry.increment("GET", str(api))
+                        delay = retry.get_retry_after(response) or retry.get_backoff_time()
+                    else:
+                        if response.status == 401:
+                            logger.info(await response.text())
+                            raise OctopusApiKeyInvalid()
+                        if response.status != 200:
+                            body = await response.text()
+                            logger.info(body)
+                            raise OctopusRequestFailed("Request failed with " + body)
+                        return orjson.loads(await response.read())
+        except aiohttp.ClientConnectionError:
+            if not retry.total:
+                raise
+            retry = retry.increment("GET", str(api))
+            delay = retry.get_backoff_time()
+
+        # Wait outside the semaphore, so other requests are not held up by the backoff
+        await asyncio.sleep(delay)
+
+
+def get_partial_name_prefix(name):
+    """
+    Returns the start of a name, used to widen a partial name lookup when the full name returns no results
+    :param name: The name of the resource
+    :return: The first half of the name, and at least the first 3 characters
+    """
+    return name[:max(3, len(name) // 2)]
+
+
+def get_fuzzy_lookup_urls(octopus_url, base_url, name):
+    """
+    Returns the URLs used to find a resource by name, in the order they are tried. A partial name lookup is tried first,
+    then a partial name lookup using the start of the name, which still matches names with a typo towards the end,
+    and finally a lookup of all the resources.
+    :param octopus_url: The Octopus URL
+    :param base_url: The path of the resource collection, e.g. "api/Spaces-1/Environments"
+    :param name: The name of the resource
+    :return: A generator of URLs
+    """
+    yield build_url(octopus_url, base_url, dict(partialname=name))
+
+    prefix = get_partial_name_prefix(name)
+    if prefix != name:
+        yield build_url(octopus_url, base_url, dict(partialname=prefix, take=batch_size))
+
+    yield build_url(octopus_url, base_url, dict(take=TAKE_ALL))
+
+
+def get_resource_fuzzy(base_url, resource_type, name, api_key, octopus_url):
+    """
+    Returns the resource that best matches the name, using the first of the lookups from get_fuzzy_lookup_urls that
+    returns any resources.
+    :param base_url: The path of the resource collection, e.g. "api/Spaces-1/Environments"
+    :param resource_type: The type of resource, used in the ResourceNotFound exception
+    :param name: The name of the resource
+    :param api_key: The Octopus API key
+    :param octopus_url: The Octopus URL
+    :return: The resource that best matches the name
+    """
+    for api in get_fuzzy_lookup_urls(octopus_url, base_url, name):
+        resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+        resource = get_item_fuzzy(response_items(resp), name)
+        if resource is not None:
+            return resource
+
+    raise ResourceNotFound(resource_type, name)
+
+
+async def get_resource_fuzzy_async(base_url, resource_type, name, api_key, octopus_url):
+    """
+    Returns the resource that best matches the name, using the first of the lookups from get_fuzzy_lookup_urls that
+    returns any resources.
+    :param base_url: The path of the resource collection, e.g. "api/Spaces-1/Environments"
+    :param resource_type: The type of resource, used in the ResourceNotFound exception
+    :param name: The name of the resource
+    :param api_key: The Octopus API key
+    :param octopus_url: The Octopus URL
+    :return: The resource that best matches the name
+    """
+    for api in get_fuzzy_lookup_urls(octopus_url, base_url, name):
+        resource = get_item_fuzzy((await get_json_async(api, api_key))["Items"], name)
+        if resource is not None:
+            return resource
+
+    raise ResourceNotFound(resource_type, name)
+
+
 @logging_wrapper
 def get_environment_fuzzy(space_id, environment_name, api_key, octopus_url):
-    base_url = f"api/{quote_safe(space_id)}/Environments"
-    api = build_url(octopus_url, base_url, dict(partialname=environment_name))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    environment = get_item_fuzzy(resp.json()["Items"], environment_name)
+    return get_resource_fuzzy(f"api/{quote_safe(space_id)}/Environments", "Environment", environment_name, api_key,
+                              octopus_url)
 
-    if environment is None:
-        api = build_url(octopus_url, base_url)
-        resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-        environment = get_item_fuzzy(resp.json()["Items"], environment_name)
-        if environment is None:
-            raise ResourceNotFound("Environment", environment_name)
 
-    return environment
+async def get_environment_fuzzy_async(space_id, environment_name, api_key, octopus_url):
+    return await get_resource_fuzzy_async(f"api/{quote_safe(space_id)}/Environments", "Environment",
+                                          environment_name, api_key, octopus_url)
 
 
 @logging_wrapper
@@ -1283,45 +1633,27 @@ def get_environments_fuzzy_cached(space_id, environment_names, api_key, octopus_
 
 
 @logging_wrapper
+@cache_lookup
 def get_environment_fuzzy_cached(space_id, environment_name, api_key, octopus_url):
-    if not environment_cache.get(octopus_url):
-        environment_cache[octopus_url] = {}
-
-    if not environment_cache[octopus_url].get(space_id):
-        environment_cache[octopus_url][space_id] = {}
-
-    if not environment_cache[octopus_url][space_id].get(environment_name):
-        environment_cache[octopus_url][space_id][environment_name] = get_environment_fuzzy(space_id, environment_name,
-                                                                                           api_key, octopus_url)
+    return get_environment_fuzzy(space_id, environment_name, api_key, octopus_url)
 
-    return environment_cache[octopus_url][space_id][environment_name]
 
-
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_tenant_fuzzy(space_id, tenant_name, api_key, octopus_url):
-    base_url = f"api/{quote_safe(space_id)}/Tenants"
-    api = build_url(octopus_url, base_url, dict(partialname=tenant_name))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    tenant = get_item_fuzzy(resp.json()["Items"], tenant_name)
+    return get_resource_fuzzy(f"api/{quote_safe(space_id)}/Tenants", "Tenant", tenant_name, api_key, octopus_url)
 
-    if tenant is None:
-        api = build_url(octopus_url, base_url)
-        resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-        tenant = get_item_fuzzy(resp.json()["Items"], tenant_name)
-        if tenant is None:
-            raise ResourceNotFound("Tenant", tenant_name)
 
-    return tenant
+async def get_tenant_fuzzy_async(space_id, tenant_name, api_key, octopus_url):
+    return await get_resource_fuzzy_async(f"api/{quote_safe(space_id)}/Tenants", "Tenant", tenant_name, api_key,
+                                          octopus_url)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup(ttl=id_lookup_ttl)
 def get_tenant(space_id, tenant_id, api_key, octopus_url):
     base_url = f"api/{quote_safe(space_id)}/Tenants/{quote_safe(tenant_id)}"
     api = build_url(octopus_url, base_url)
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()
+    return get_json_conditional(api, api_key)
 
 
 @logging_wrapper
@@ -1332,38 +1664,26 @@ def get_tenants_fuzzy_cached(space_id, tenant_names, api_key, octopus_url):
 
 
 @logging_wrapper
+@cache_lookup
 def get_tenant_fuzzy_cached(space_id, tenant_name, api_key, octopus_url):
-    if not tenant_cache.get(octopus_url):
-        tenant_cache[octopus_url] = {}
-
-    if not tenant_cache[octopus_url].get(space_id):
-        tenant_cache[octopus_url][space_id] = {}
-
-    if not tenant_cache[octopus_url][space_id].get(tenant_name):
-        tenant_cache[octopus_url][space_id][tenant_name] = get_tenant_fuzzy(space_id, tenant_name, api_key, octopus_url)
+    return get_tenant_fuzzy(space_id, tenant_name, api_key, octopus_url)
 
-    return tenant_cache[octopus_url][space_id][tenant_name]
 
-
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup
 def get_channels(space_id, project_id, api_key, octopus_url):
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/projects/{quote_safe(project_id)}/Channels")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    channels = resp.json()
+    channels = get_json_conditional(api, api_key)
     return channels['Items']
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup(ttl=id_lookup_ttl)
 def get_channel(space_id, channel_id, api_key, octopus_url):
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Channels/{quote_safe(channel_id)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-
-    return resp.json()
+    return get_json_conditional(api, api_key)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_channel_by_name(space_id, project_id, channel_name, api_key, octopus_url):
     channels = get_channels(space_id, project_id, api_key, octopus_url)
@@ -1374,7 +1694,6 @@ def get_channel_by_name(space_id, project_id, channel_name, api_key, octopus_url
     return matching_channel
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_default_channel(space_id, project_id, api_key, octopus_url):
     channels = get_channels(space_id, project_id, api_key, octopus_url)
@@ -1385,13 +1704,12 @@ def get_default_channel(space_id, project_id, api_key, octopus_url):
     return default_channel[0]
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_release_fuzzy(space_id, project_id, release_version, api_key, octopus_url):
     base_url = f"api/{quote_safe(space_id)}/projects/{quote_safe(project_id)}/releases"
     api = build_url(octopus_url, base_url, dict(searchByVersion=release_version))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    releases = resp.json()
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    releases = orjson.loads(resp.data)
     matching_releases = [release for release in releases['Items'] if release['Version'] == release_version]
     if len(matching_releases) == 0:
         raise ResourceNotFound("Release", release_version)
@@ -1399,25 +1717,22 @@ def get_release_fuzzy(space_id, project_id, release_version, api_key, octopus_ur
     return matching_releases[0]
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_version_controlled_project_release_template(space_id, project_id, channel_id, git_ref, api_key, octopus_url):
     api = build_url(octopus_url,
                     f"api/{quote_safe(space_id)}/projects/{quote_safe(project_id)}/{quote_safe(git_ref)}/deploymentprocesses/template?channel={quote_safe(channel_id)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_database_project_release_template(space_id, project_id, channel_id, api_key, octopus_url):
     api = build_url(octopus_url,
                     f"api/{quote_safe(space_id)}/deploymentprocesses/deploymentprocess-{quote_safe(project_id)}/template?channel={quote_safe(channel_id)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_release_template_and_default_branch(space_id, project, channel_id, git_ref, api_key,
                                             octopus_url):
@@ -1439,100 +1754,86 @@ def get_release_template_and_default_branch(space_id, project, channel_id, git_r
     return release_template, default_branch
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_project_version_controlled_branch(space_id, project_id, branch_name, api_key, octopus_url):
     api = build_url(octopus_url,
                     f"api/{quote_safe(space_id)}/projects/{quote_safe(project_id)}/git/branches/{quote_safe(branch_name)}")
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    return resp.json()
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return orjson.loads(resp.data)
 
 
 @logging_wrapper
 def get_channel_cached(space_id, channel_id, api_key, octopus_url):
-    if not channel_cache.get(octopus_url):
-        channel_cache[octopus_url] = {}
-
-    if not channel_cache[octopus_url].get(space_id):
-        channel_cache[octopus_url][space_id] = {}
-
-    if not channel_cache[octopus_url][space_id].get(channel_id):
-        channel_cache[octopus_url][space_id][channel_id] = get_channel(space_id, channel_id, api_key, octopus_url)
+    # get_channel is cached in the lookup_cache
+    return get_channel(space_id, channel_id, api_key, octopus_url)
 
-    return channel_cache[octopus_url][space_id][channel_id]
 
-
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_packages(space_id, feed_id, package_id, api_key, octopus_url, take=1):
     base_url = f'api/{quote_safe(space_id)}/feeds/{quote_safe(feed_id)}/packages/versions'
     api = build_url(octopus_url, base_url, dict(take=take, packageId=quote_safe(package_id)))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    json = resp.json()
-    return json["Items"]
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    return response_items(resp)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup(ttl=short_lookup_ttl)
 def get_project_fuzzy(space_id, project_name, api_key, octopus_url):
-    # First try to find a nice match using a partial name lookup.
-    # This is a shortcut that means we don't have to loop the entire list of project.
-    # This will succeed if any resources match the supplied partial name.
-    base_url = f"api/{quote_safe(space_id)}/Projects"
-    api = build_url(octopus_url, base_url, dict(partialname=project_name))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    project = get_item_fuzzy(resp.json()["Items"], project_name)
-
-    # This is a higher cost fallback used when the partial name returns no results.
-    if project is None:
-        api = build_url(octopus_url, base_url)
-        resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-        project = get_item_fuzzy(resp.json()["Items"], project_name)
-        if project is None:
-            raise ResourceNotFound("Project", project_name)
-
-    return project
+    return get_resource_fuzzy(f"api/{quote_safe(space_id)}/Projects", "Project", project_name, api_key, octopus_url)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_runbook_fuzzy(space_id, project_id, runbook_name, api_key, octopus_url):
-    # First try to find a nice match using a partial name lookup.
-    # This is a shortcut that means we don't have to loop the entire list of runbooks.
-    # This will succeed if any resources match the supplied partial name.
-    base_url = f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Runbooks"
-    api = build_url(octopus_url, base_url, dict(partialname=runbook_name))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    runbook = get_item_fuzzy(resp.json()["Items"], runbook_name)
-
-    # This is a higher cost fallback used when the partial name returns no results.
-    if runbook is None:
-        api = build_url(octopus_url, base_url)
-        resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-        runbook = get_item_fuzzy(resp.json()["Items"], runbook_name)
-        if runbook is None:
-            raise ResourceNotFound("Runbook", runbook_name)
+    return get_resource_fuzzy(f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Runbooks", "Runbook",
+                              runbook_name, api_key, octopus_url)
+
+
+async def get_runbook_fuzzy_async(space_id, project_id, runbook_name, api_key, octopus_url):
+    return await get_resource_fuzzy_async(f"api/{quote_safe(space_id)}/Projects/{quote_safe(project_id)}/Runbooks",
+                                          "Runbook", runbook_name, api_key, octopus_url)
+
 
-    return runbook
+def get_project_and_runbook_fuzzy(space_id, project_name, runbook_name, api_key, octopus_url):
+    """
+    Looks up a project, and then the runbook in that project
+    :param space_id: The ID of the space
+    :param project_name: The name of the project
+    :param runbook_name: The name of the runbook
+    :param api_key: The Octopus API key
+    :param octopus_url: The Octopus URL
+    :return: The project and the runbook
+    """
+    project = get_project_fuzzy(space_id, project_name, api_key, octopus_url)
+    runbook = get_runbook_fuzzy(space_id, project["Id"], runbook_name, api_key, octopus_url)
+    return project, runbook
 
 
 @logging_wrapper
+@ensure_strings_not_empty(
+    my_octopus_api='my_octopus_api must be the Octopus Url (run_published_runbook_fuzzy).',
+    my_api_key='my_api_key must be the Octopus Api key (run_published_runbook_fuzzy).',
+    space_id='space_id must be the space ID (run_published_runbook_fuzzy).',
+    project_name='project_name must be the project (run_published_runbook_fuzzy).',
+    runbook_name='runbook_name must be the runbook (run_published_runbook_fuzzy).',
+    environment_name='environment_name must be the environment (run_published_runbook_fuzzy).')
 def run_published_runbook_fuzzy(space_id, project_name, runbook_name, environment_name, tenant_name, my_api_key,
                                 my_octopus_api, log_query=None):
     """
     Runs a published runbook
     """
-    ensure_string_not_empty(my_octopus_api, 'my_octopus_api must be the Octopus Url (run_published_runbook_fuzzy).')
-    ensure_string_not_empty(my_api_key, 'my_api_key must be the Octopus Api key (run_published_runbook_fuzzy).')
-    ensure_string_not_empty(space_id, 'space_id must be the space ID (run_published_runbook_fuzzy).')
-    ensure_string_not_empty(project_name, 'project_name must be the project (run_published_runbook_fuzzy).')
-    ensure_string_not_empty(runbook_name, 'runbook_name must be the runbook (run_published_runbook_fuzzy).')
-    ensure_string_not_empty(environment_name, 'environment_name must be the environment (run_published_runbook_fuzzy).')
+    # The environment and tenant don't depend on the project, so they are looked up at the same time as the project
+    # and runbook. The environment and tenant lookups are cached, so resources already resolved by the caller are not
+    # requested again. The runbook is always looked up, as it holds the snapshot that was most recently published.
+    project_and_runbook_lookup = lookup_executor.submit(get_project_and_runbook_fuzzy, space_id, project_name,
+                                                        runbook_name, my_api_key, my_octopus_api)
+    environment_lookup = lookup_executor.submit(get_environment_fuzzy_cached, space_id, environment_name, my_api_key,
+                                                my_octopus_api)
+    tenant_lookup = lookup_executor.submit(get_tenant_fuzzy_cached, space_id, tenant_name, my_api_key,
+                                           my_octopus_api) if tenant_name else None
 
-    project = get_project_fuzzy(space_id, project_name, my_api_key, my_octopus_api)
-    runbook = get_runbook_fuzzy(space_id, project["Id"], runbook_name, my_api_key, my_octopus_api)
-    environment = get_environment_fuzzy(space_id, environment_name, my_api_key, my_octopus_api)
-    tenant = get_tenant_fuzzy(space_id, tenant_name, my_api_key, my_octopus_api) if tenant_name else None
+    project, runbook = project_and_runbook_lookup.result()
+    environment = environment_lookup.result()
+    tenant = tenant_lookup.result() if tenant_lookup else None
 
     if not runbook['PublishedRunbookSnapshotId']:
         raise RunbookNotPublished(runbook_name)
@@ -1563,24 +1864,23 @@ def run_published_runbook_fuzzy(space_id, project_name, runbook_name, environmen
                     Environment Names: {environment_name}
                     Environment Id: {environment['Id']}""")
 
-    response = handle_response(
-        lambda: http.request("POST", api, json=runbook_run, headers=get_octopus_headers(my_api_key)))
+    response = handle_response("POST", api, json=runbook_run, headers=get_octopus_headers(my_api_key))
 
-    return response.json()
+    return orjson.loads(response.data)
 
 
 @logging_wrapper
+@ensure_strings_not_empty(
+    my_octopus_api='my_octopus_api must be the Octopus Url (create_release_fuzzy).',
+    my_api_key='my_api_key must be the Octopus Api key (create_release_fuzzy).',
+    space_id='space_id must be the space ID (create_release_fuzzy).',
+    project_name='project_name must be the project (create_release_fuzzy).',
+    release_version='release_version must be the release version (create_release_fuzzy).')
 def create_release_fuzzy(space_id, project_name, git_ref, release_version, channel_name, my_api_key,
                          my_octopus_api, log_query=None):
     """
     Creates a release
     """
-    ensure_string_not_empty(my_octopus_api, 'my_octopus_api must be the Octopus Url (create_release_fuzzy).')
-    ensure_string_not_empty(my_api_key, 'my_api_key must be the Octopus Api key (create_release_fuzzy).')
-    ensure_string_not_empty(space_id, 'space_id must be the space ID (create_release_fuzzy).')
-    ensure_string_not_empty(project_name, 'project_name must be the project (create_release_fuzzy).')
-    ensure_string_not_empty(release_version, 'release_version must be the release version (create_release_fuzzy).')
-
     project = get_project_fuzzy(space_id, project_name, my_api_key, my_octopus_api)
 
     base_url = f"api/{quote_safe(space_id)}/releases"
@@ -1610,9 +1910,12 @@ def create_release_fuzzy(space_id, project_name, git_ref, release_version, chann
         release_request['VersionControlReference']['GitRef'] = git_ref
 
     # Get default package versions
-    for template_package in release_template['Packages']:
-        packages = get_packages(space_id, template_package['FeedId'], template_package['PackageId'], my_api_key,
-                                my_octopus_api)
+    # The packages are looked up at the same time. They are not cached, so a package pushed moments ago is selected.
+    template_packages = release_template['Packages']
+    package_versions = lookup_executor.map(
+        lambda package: get_packages(space_id, package['FeedId'], package['PackageId'], my_api_key, my_octopus_api),
+        template_packages)
+    for template_package, packages in zip(template_packages, package_versions):
         selected_package = {
             'ActionName': template_package['ActionName'],
             'PackageReferenceName': template_package['PackageReferenceName'],
@@ -1628,27 +1931,26 @@ def create_release_fuzzy(space_id, project_name, git_ref, release_version, chann
                     GitRef: {git_ref}
                     Channel Id: {channel['Id']}
                     Version: {release_version}
-                    Selected Packages: {",".join(map(lambda p: f"{p['ActionName']}:{p['Version']}" + (f" ({p['PackageReferenceName']})" if p['PackageReferenceName'] else ""), release_request['SelectedPackages']))}""")
+                    Selected Packages: {",".join(f"{p['ActionName']}:{p['Version']}" + (f" ({p['PackageReferenceName']})" if p['PackageReferenceName'] else "") for p in release_request['SelectedPackages'])}""")
 
-    response = handle_response(
-        lambda: http.request("POST", api, json=release_request, headers=get_octopus_headers(my_api_key)))
+    response = handle_response("POST", api, json=release_request, headers=get_octopus_headers(my_api_key))
 
-    return response.json()
+    return orjson.loads(response.data)
 
 
 @logging_wrapper
+@ensure_strings_not_empty(
+    my_octopus_api='my_octopus_api must be the Octopus Url (deploy_release_fuzzy).',
+    my_api_key='my_api_key must be the Octopus Api key (deploy_release_fuzzy).',
+    space_id='space_id must be the space ID (deploy_release_fuzzy).',
+    project_id='project_id must be the project ID (deploy_release_fuzzy).',
+    release_id='release_id must be the release ID (deploy_release_fuzzy).',
+    environment_name='environment_name must be the environment (deploy_release_fuzzy).')
 def deploy_release_fuzzy(space_id, project_id, release_id, environment_name, tenant_name,
                          my_api_key, my_octopus_api, log_query=None):
     """
     Deploys a release
     """
-    ensure_string_not_empty(my_octopus_api, 'my_octopus_api must be the Octopus Url (deploy_release_fuzzy).')
-    ensure_string_not_empty(my_api_key, 'my_api_key must be the Octopus Api key (deploy_release_fuzzy).')
-    ensure_string_not_empty(space_id, 'space_id must be the space ID (deploy_release_fuzzy).')
-    ensure_string_not_empty(project_id, 'project_id must be the project ID (deploy_release_fuzzy).')
-    ensure_string_not_empty(release_id, 'release_id must be the release ID (deploy_release_fuzzy).')
-    ensure_string_not_empty(environment_name, 'environment_name must be the environment (deploy_release_fuzzy).')
-
     base_url = f"api/{quote_safe(space_id)}/deployments"
     api = build_url(my_octopus_api, base_url)
 
@@ -1677,10 +1979,9 @@ def deploy_release_fuzzy(space_id, project_id, release_id, environment_name, ten
                     Environment Id: {environment_id}
                     Tenant ID: {tenant['Id'] if tenant_name else None}""")
 
-    response = handle_response(
-        lambda: http.request("POST", api, json=deploy_request, headers=get_octopus_headers(my_api_key)))
+    response = handle_response("POST", api, json=deploy_request, headers=get_octopus_headers(my_api_key))
 
-    return response.json()
+    return orjson.loads(response.data)
 
 
 async def get_release_async(space_id, release_id, api_key, octopus_url):
@@ -1691,13 +1992,9 @@ async def get_release_async(space_id, release_id, api_key, octopus_url):
 
     api = build_url(octopus_url, f"api/{quote_safe(space_id)}/Releases/{quote_safe(release_id)}")
 
-    async with sem:
-        async with aiohttp.ClientSession(headers=get_octopus_headers(api_key)) as session:
-            async with session.get(str(api)) as response:
-                return await response.json()
+    return await get_json_async(api, api_key)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_artifacts(space_id, server_task, api_key, octopus_url):
     """
@@ -1741,12 +2038,11 @@ def get_artifacts(space_id, server_task, api_key, octopus_url):
     """
     base_url = f"api/{quote_safe(space_id)}/artifacts"
     api = build_url(octopus_url, base_url, dict(regarding=server_task, take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
 
-    return resp.json()
+    return orjson.loads(resp.data)
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_task_interruptions(space_id, server_task, api_key, octopus_url):
     """
@@ -1761,16 +2057,16 @@ def get_task_interruptions(space_id, server_task, api_key, octopus_url):
 
     base_url = f"api/{quote_safe(space_id)}/interruptions"
     api = build_url(octopus_url, base_url, dict(regarding=server_task))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    interruptions = resp.json()
+    resp = handle_response("GET", api, headers=get_octopus_headers(api_key))
+    interruptions = orjson.loads(resp.data)
     if len(interruptions['Items']) == 0:
         return None
 
     return interruptions['Items']
 
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
+@cache_lookup(ttl=short_lookup_ttl)
 def get_users(api_key, octopus_url):
     """
     Get the list of users
@@ -1781,8 +2077,7 @@ def get_users(api_key, octopus_url):
 
     base_url = f"api/users"
     api = build_url(octopus_url, base_url, dict(take=TAKE_ALL))
-    resp = handle_response(lambda: http.request("GET", api, headers=get_octopus_headers(api_key)))
-    interruptions = resp.json()
+    interruptions = get_json_conditional(api, api_key, list_etag_ttl)
     if len(interruptions['Items']) == 0:
         return None
 
@@ -17,7 +17,6 @@ from domain.sanitizers.sanitized_list import sanitize_projects, sanitize_tenants
     sanitize_certificates, sanitize_lifecycles, sanitize_workerpools, sanitize_machinepolicies, sanitize_tenanttagsets, \
     sanitize_projectgroups, none_if_falesy, sanitize_steps, none_if_falesy_or_all, sanitize_variables
 from domain.validation.argument_validation import ensure_string_not_empty
-from infrastructure.http_pool import http
 from infrastructure.octopus import handle_response, logging_wrapper
 
 logger = configure_logging(__name__)
@@ -182,11 +181,10 @@ def get_octoterra_space(query, space_id, project_names, runbook_names, target_na
         "X-Octopus-Url": octopus_url
     }
 
-    resp = timing_wrapper(lambda: handle_response(lambda: http.request("POST",
-                                                                       os.environ[
-                                                                           "APPLICATION_OCTOTERRA_URL"] + "/api/octoterra",
-                                                                       body=json.dumps(body),
-                                                                       headers=headers)), "octoterra")
+    resp = timing_wrapper(lambda: handle_response("POST",
+                                                  os.environ["APPLICATION_OCTOTERRA_URL"] + "/api/octoterra",
+                                                  body=json.dumps(body),
+                                                  headers=headers), "octoterra")
 
     answer = resp.data.decode("utf-8")
 
@@ -1,6 +1,7 @@
 import unittest
 
-from domain.validation.argument_validation import ensure_string_not_empty, ensure_string, ensure_not_falsy
+from domain.validation.argument_validation import ensure_string_not_empty, ensure_string, ensure_not_falsy, \
+    ensure_strings_not_empty
 
 
 class EnsureTests(unittest.TestCase):
@@ -36,3 +37,20 @@ class EnsureTests(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             ensure_not_falsy(None, "message")
+
+    def test_ensure_strings_not_empty(self):
+        @ensure_strings_not_empty(first="first message", second="second message")
+        def join(first, second, third=None):
+            return first + second
+
+        self.assertEqual(join("a", "b"), "ab")
+        self.assertEqual(join("a", second="b"), "ab")
+
+        with self.assertRaisesRegex(ValueError, "first message"):
+            join("", "b")
+
+        with self.assertRaisesRegex(ValueError, "second message"):
+            join("a", " ")
+
+        with self.assertRaisesRegex(ValueError, "second message"):
+            join(first="a", second=123)
@@ -1,6 +1,6 @@
 import unittest
 
-from domain.sanitizers.url_sanitizer import quote_safe
+from domain.sanitizers.url_sanitizer import quote_safe, quote_string
 
 
 class QuoteSafeTest(unittest.TestCase):
@@ -12,3 +12,12 @@ class QuoteSafeTest(unittest.TestCase):
         self.assertEqual(quote_safe(None), "")
         self.assertEqual(quote_safe({}), "")
         self.assertEqual(quote_safe([]), "")
+
+    def test_quote_safe_repeated(self):
+        self.assertEqual(quote_safe("Spaces-1"), "Spaces-1")
+        hits = quote_string.cache_info().hits
+        self.assertEqual(quote_safe("Spaces-1"), "Spaces-1")
+        self.assertEqual(quote_string.cache_info().hits, hits + 1)
+        self.assertEqual(quote_safe("a b/c"), "a%20b%2Fc")
+        self.assertEqual(quote_safe("a b/c"), "a%20b%2Fc")
+        self.assertEqual(quote_safe(["a b/c"]), "")
@@ -0,0 +1,62 @@
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from infrastructure.octopus import get_batches_generator
+
+
+class RecordingExecutor:
+    """
+    An executor that records submitted calls without running them
+    """
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, func, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+class BatchesGeneratorTest(unittest.TestCase):
+    """
+    Tests the prefetching batch generator with a batch function that returns a range of numbers
+    """
+
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_batch(self, skip, take, total):
+        with self.lock:
+            self.calls.append((skip, take))
+        return list(range(skip, min(skip + take, total)))
+
+    @patch("infrastructure.octopus.batch_size", 3)
+    def test_pages_are_yielded_in_order(self):
+        self.assertEqual(list(get_batches_generator(self.get_batch, 8)), list(range(8)))
+        self.assertEqual(sorted(self.calls), [(0, 3), (3, 3), (6, 3)])
+
+    @patch("infrastructure.octopus.batch_size", 3)
+    def test_short_page_stops_the_generator(self):
+        self.assertEqual(list(get_batches_generator(self.get_batch, 2)), [0, 1])
+        self.assertEqual(self.calls, [(0, 3)])
+
+    @patch("infrastructure.octopus.batch_size", 3)
+    def test_empty_page_after_full_page_stops_the_generator(self):
+        self.assertEqual(list(get_batches_generator(self.get_batch, 6)), list(range(6)))
+        self.assertEqual(sorted(self.calls), [(0, 3), (3, 3), (6, 3)])
+
+    @patch("infrastructure.octopus.batch_size", 3)
+    def test_closing_early_cancels_the_prefetch(self):
+        executor = RecordingExecutor()
+
+        with patch("infrastructure.octopus.prefetch_executor", executor):
+            generator = get_batches_generator(self.get_batch, 8)
+            self.assertEqual(next(generator), 0)
+            generator.close()
+
+        self.assertEqual(len(executor.futures), 1)
+        self.assertTrue(executor.futures[0].cancelled())
@@ -0,0 +1,127 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from domain.exceptions.request_failed import OctopusRequestFailed
+from domain.exceptions.resource_not_found import ResourceNotFound
+from domain.exceptions.space_not_found import SpaceNotFound
+from infrastructure.octopus import cache_lookup, inflight_lookups, lookup_cache
+
+
+class CacheLookupTest(unittest.TestCase):
+    """
+    Tests the caching, sharing of concurrent calls, and negative caching of the cache_lookup decorator
+    """
+
+    thread_count = 8
+
+    def setUp(self):
+        lookup_cache.clear()
+
+    def call_concurrently(self, func, *args):
+        """
+        Calls the function from multiple threads at the same time, returning the result or exception of each call
+        """
+        barrier = threading.Barrier(self.thread_count)
+
+        def call():
+            barrier.wait()
+            try:
+                return func(*args)
+            except Exception as ex:
+                return ex
+
+        with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
+            return list(executor.map(lambda _: call(), range(self.thread_count)))
+
+    def test_concurrent_lookups_share_one_call(self):
+        calls = []
+
+        @cache_lookup
+        def slow_lookup(space_id, api_key):
+            calls.append(space_id)
+            time.sleep(0.2)
+            return {"Id": space_id}
+
+        results = self.call_concurrently(slow_lookup, "Spaces-1", "API-1")
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"Id": "Spaces-1"}] * self.thread_count)
+        self.assertFalse(inflight_lookups)
+
+    def test_concurrent_lookup_failure_reaches_all_waiters(self):
+        calls = []
+
+        @cache_lookup
+        def failing_lookup(space_id, api_key):
+            calls.append(space_id)
+            time.sleep(0.2)
+            raise OctopusRequestFailed("Request failed with 503")
+
+        results = self.call_concurrently(failing_lookup, "Spaces-1", "API-1")
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(isinstance(result, OctopusRequestFailed) for result in results))
+        self.assertTrue(all(str(result) == "Request failed with 503" for result in results))
+        self.assertFalse(inflight_lookups)
+
+        # Failures other than a missing resource are not cached
+        with self.assertRaises(OctopusRequestFailed):
+            failing_lookup("Spaces-1", "API-1")
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(inflight_lookups)
+
+    def test_concurrent_lookup_failure_keeps_its_message(self):
+        @cache_lookup
+        def missing_space(space_name, api_key):
+            time.sleep(0.2)
+            raise SpaceNotFound(space_name)
+
+        results = self.call_concurrently(missing_space, "Dev", "API-1")
+
+        self.assertTrue(all(isinstance(result, SpaceNotFound) for result in results))
+        self.assertTrue(all(str(result) == "Space Dev not found in Octopus" for result in results))
+
+    def test_resource_not_found_is_cached_until_it_expires(self):
+        calls = []
+
+        @cache_lookup
+        def missing_lookup(space_id, name, api_key):
+            calls.append(name)
+            raise ResourceNotFound("Project", name)
+
+        with patch("infrastructure.octopus.not_found_ttl", 0.5):
+            with self.assertRaises(ResourceNotFound) as first:
+                missing_lookup("Spaces-1", "Missing", "API-1")
+            with self.assertRaises(ResourceNotFound) as second:
+                missing_lookup("Spaces-1", "Missing", "API-1")
+
+            self.assertEqual(len(calls), 1)
+            self.assertIsNot(first.exception, second.exception)
+            self.assertEqual(second.exception.resource_type, "Project")
+            self.assertEqual(second.exception.resource_name, "Missing")
+
+            time.sleep(1)
+
+            with self.assertRaises(ResourceNotFound):
+                missing_lookup("Spaces-1", "Missing", "API-1")
+            self.assertEqual(len(calls), 2)
+
+    def test_api_keys_are_cached_separately(self):
+        calls = []
+
+        @cache_lookup
+        def user_lookup(api_key, octopus_url):
+            calls.append(api_key)
+            return {"ApiKey": api_key}
+
+        self.assertEqual(user_lookup("API-1", "https://example.org"), {"ApiKey": "API-1"})
+        self.assertEqual(user_lookup("API-2", "https://example.org"), {"ApiKey": "API-2"})
+        self.assertEqual(user_lookup("API-1", "https://example.org"), {"ApiKey": "API-1"})
+        self.assertEqual(user_lookup(api_key="API-2", octopus_url="https://example.org"), {"ApiKey": "API-2"})
+
+        self.assertEqual(calls, ["API-1", "API-2"])
+        # The cache keys hold a hash of the API key rather than the key itself
+        self.assertFalse(any("API-1" in key or "API-2" in key for key in lookup_cache))
@@ -0,0 +1,85 @@
+import time
+import unittest
+from unittest.mock import patch
+
+import orjson
+
+from infrastructure.octopus import get_json_conditional, etag_cache
+
+
+class StubResponse:
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.data = orjson.dumps(body) if body is not None else b""
+        self.headers = headers or {}
+
+
+class StubPool:
+    """
+    A connection pool that returns the queued responses and records the headers of each request
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.request_headers = []
+
+    def request(self, method, url, headers=None, body=None, retries=None):
+        self.request_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+class ConditionalRequestTest(unittest.TestCase):
+    """
+    Tests that get_json_conditional sends the cached ETag and returns the cached body for a 304 response
+    """
+
+    def setUp(self):
+        etag_cache.clear()
+
+    def test_not_modified_returns_cached_body(self):
+        body = {"Id": "Spaces-1", "Name": "Default"}
+        pool = StubPool(StubResponse(200, body, {"ETag": '"v1"'}), StubResponse(304))
+
+        with patch("infrastructure.octopus.http", pool):
+            first = get_json_conditional("https://example.org/api/spaces/Spaces-1", "API-1")
+            second = get_json_conditional("https://example.org/api/spaces/Spaces-1", "API-1")
+
+        self.assertEqual(first, body)
+        self.assertIs(second, first)
+        self.assertNotIn("If-None-Match", pool.request_headers[0])
+        self.assertEqual(pool.request_headers[1]["If-None-Match"], '"v1"')
+
+    def test_modified_response_replaces_cached_body(self):
+        pool = StubPool(StubResponse(200, {"Name": "Old"}, {"ETag": '"v1"'}),
+                        StubResponse(200, {"Name": "New"}, {"ETag": '"v2"'}),
+                        StubResponse(304))
+
+        with patch("infrastructure.octopus.http", pool):
+            get_json_conditional("https://example.org/api/spaces/Spaces-1", "API-1")
+            updated = get_json_conditional("https://example.org/api/spaces/Spaces-1", "API-1")
+            cached = get_json_conditional("https://example.org/api/spaces/Spaces-1", "API-1")
+
+        self.assertEqual(updated, {"Name": "New"})
+        self.assertEqual(cached, {"Name": "New"})
+        self.assertEqual(pool.request_headers[2]["If-None-Match"], '"v2"')
+
+    def test_etags_are_not_shared_between_api_keys(self):
+        pool = StubPool(StubResponse(200, {"Name": "Default"}, {"ETag": '"v1"'}),
+                        StubResponse(200, {"Name": "Default"}, {"ETag": '"v1"'}))
+
+        with patch("infrastructure.octopus.http", pool):
+            get_json_conditional("https://example.org/api/spaces/Spaces-1", "API-1")
+            get_json_conditional("https://example.org/api/spaces/Spaces-1", "API-2")
+
+        self.assertNotIn("If-None-Match", pool.request_headers[1])
+
+    def test_ttl_overrides_the_cache_expiry(self):
+        pool = StubPool(StubResponse(200, {"Items": []}, {"ETag": '"v1"'}),
+                        StubResponse(200, {"Items": []}, {"ETag": '"v1"'}))
+
+        with patch("infrastructure.octopus.http", pool):
+            get_json_conditional("https://example.org/api/users", "API-1", 0.5)
+            time.sleep(1)
+            get_json_conditional("https://example.org/api/users", "API-1", 0.5)
+
+        self.assertNotIn("If-None-Match", pool.request_headers[1])
@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import patch
+
+from infrastructure.http_pool import TAKE_ALL
+from infrastructure.octopus import get_fuzzy_lookup_urls, get_partial_name_prefix
+
+
+class FuzzyLookupUrlsTest(unittest.TestCase):
+    def test_get_partial_name_prefix(self):
+        self.assertEqual(get_partial_name_prefix("Deploy Web App"), "Deploy ")
+        self.assertEqual(get_partial_name_prefix("Test"), "Tes")
+        self.assertEqual(get_partial_name_prefix("Dev"), "Dev")
+        self.assertEqual(get_partial_name_prefix("A"), "A")
+
+    @patch("infrastructure.octopus.batch_size", 50)
+    def test_lookup_order(self):
+        urls = list(get_fuzzy_lookup_urls("https://example.org", "api/Spaces-1/Projects", "Deploy Web App"))
+        self.assertEqual(urls, [
+            "https://example.org/api/Spaces-1/Projects?partialname=Deploy+Web+App",
+            "https://example.org/api/Spaces-1/Projects?partialname=Deploy+&take=50",
+            f"https://example.org/api/Spaces-1/Projects?take={TAKE_ALL}"])
+
+    def test_short_name_skips_prefix_lookup(self):
+        urls = list(get_fuzzy_lookup_urls("https://example.org", "api/Spaces-1/Environments", "Dev"))
+        self.assertEqual(urls, [
+            "https://example.org/api/Spaces-1/Environments?partialname=Dev",
+            f"https://example.org/api/Spaces-1/Environments?take={TAKE_ALL}"])
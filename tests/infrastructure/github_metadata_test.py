@@ -0,0 +1,31 @@
+import unittest
+
+from infrastructure.octopus import get_github_metadata
+
+
+class GitHubMetadataTest(unittest.TestCase):
+    def test_prefixes(self):
+        self.assertEqual(get_github_metadata("GitHub Owner: OctopusSamples"), {"owner": "OctopusSamples"})
+        self.assertEqual(get_github_metadata("* GitHub Owner: OctopusSamples"), {"owner": "OctopusSamples"})
+        self.assertEqual(get_github_metadata("  - GitHub Owner: OctopusSamples"), {"owner": "OctopusSamples"})
+        self.assertEqual(get_github_metadata("The GitHub Owner: OctopusSamples"), {})
+
+    def test_case(self):
+        self.assertEqual(get_github_metadata("github repo: OctoPetShop"), {"repo": "OctoPetShop"})
+        self.assertEqual(get_github_metadata("GITHUB WORKFLOW: build.yaml"), {"workflow": "build.yaml"})
+
+    def test_run_id(self):
+        self.assertEqual(get_github_metadata("GitHub Run ID: 123"), {"runid": "123"})
+        self.assertEqual(get_github_metadata("GitHub RunId: 123"), {"runid": "123"})
+
+    def test_first_value_wins(self):
+        text = "GitHub Owner: First\n* GitHub Owner: Second\nGitHub Repo:  OctoPetShop  "
+        self.assertEqual(get_github_metadata(text), {"owner": "First", "repo": "OctoPetShop"})
+
+    def test_missing_fields(self):
+        text = "A description\n* GitHub Owner: OctopusSamples"
+        metadata = get_github_metadata(text)
+        self.assertEqual(metadata, {"owner": "OctopusSamples"})
+        self.assertIsNone(metadata.get("repo"))
+        self.assertEqual(get_github_metadata(""), {})
+        self.assertEqual(get_github_metadata(None), {})